@@ -101,50 +101,38 @@ class HealthcareIoTSystem(System):
         
         return cpu
     
-    def create_l1_instruction_cache(self):
+    def create_l1_cache(self, tag_latency, data_latency):
         """
-        Create L1 instruction cache: 32KB, 4-way set associative
-        Optimized for low-power operation with way prediction
+        Create an L1 cache: 32KB, 4-way set associative
+        Shared by the instruction and data caches, which differ only in latency
         """
         cache = Cache()
         cache.size = '32kB'
         cache.assoc = 4
-        cache.tag_latency = 1
-        cache.data_latency = 1
+        cache.tag_latency = tag_latency
+        cache.data_latency = data_latency
         cache.response_latency = 1
         cache.mshrs = 4
         cache.tgts_per_mshr = 20
         cache.write_buffers = 8
+        cache.writeback_clean = False  # Write-back only dirty lines
         cache.replacement_policy = LRURP()
         
-        # Connect ports
-        cache.cpu_side = Port()
-        cache.mem_side = Port()
-        
         return cache
     
+    def create_l1_instruction_cache(self):
+        """
+        Create L1 instruction cache: 32KB, 4-way set associative
+        Optimized for low-power operation with way prediction
+        """
+        return self.create_l1_cache(tag_latency=1, data_latency=1)
+    
     def create_l1_data_cache(self):
         """
         Create L1 data cache: 32KB, 4-way set associative
         Write-back policy for energy efficiency
         """
-        cache = Cache()
-        cache.size = '32kB'
-        cache.assoc = 4
-        cache.tag_latency = 2
-        cache.data_latency = 2
-        cache.response_latency = 1
-        cache.mshrs = 4
-        cache.tgts_per_mshr = 20
-        cache.write_buffers = 8
-        cache.writeback_clean = False  # Write-back only dirty lines
-        cache.replacement_policy = LRURP()
-        
-        # Connect ports
-        cache.cpu_side = Port()
-        cache.mem_side = Port()
-        
-        return cache
+        return self.create_l1_cache(tag_latency=2, data_latency=2)
     
     def create_l2_cache(self):
         """
@@ -163,10 +151,6 @@ class HealthcareIoTSystem(System):
         cache.writeback_clean = False
         cache.replacement_policy = LRURP()
         
-        # Connect ports
-        cache.cpu_side = VectorPort()  # Vector port for multiple L1 connections
-        cache.mem_side = Port()
-        
         return cache
     
     def create_memory_controller(self):
@@ -8,13 +8,21 @@ figures and graphs for the Phase 3 report.
 """
 
 import json
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 from matplotlib import rcParams
 
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
 # Configure matplotlib for APA style figures
 rcParams['font.family'] = 'sans-serif'
 rcParams['font.sans-serif'] = ['Arial', 'Helvetica']
@@ -30,6 +38,14 @@ rcParams['figure.titlesize'] = 11
 RESULTS_DIR = "./simulation_results"
 FIGURES_DIR = "./figures"
 
+# PNG zlib level: 1 encodes several times faster than PIL's default (6) at
+# the cost of larger files; set ARCHIVE_FIGURES=1 for compact archival output
+PNG_COMPRESS_LEVEL = 6 if os.environ.get("ARCHIVE_FIGURES") == "1" else 1
+
+# Shared savefig options for every figure
+FIG_KW = dict(dpi=300, bbox_inches='tight',
+              pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+
 def create_figures_directory():
     """Create directory for generated figures"""
     os.makedirs(FIGURES_DIR, exist_ok=True)
@@ -43,99 +59,163 @@ def load_dvfs_results():
         print(f"Warning: {results_file} not found")
         return generate_sample_dvfs_data()
     
-    with open(results_file, 'r') as f:
-        return json.load(f)
+    # Read the whole file at once and parse from bytes
+    with open(results_file, 'rb') as f:
+        data = f.read()
+    
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def reuse_figure(figsize, nrows=1, ncols=1):
+    """
+    Return a cleared figure and axes, reusing one pyplot Figure for every plot
+
+    Axes come back as from plt.subplots: a single Axes for the default 1x1
+    layout, otherwise an array of Axes.
+    """
+    fig = plt.figure(num=1)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig, fig.subplots(nrows, ncols)
+
+def index_results(results):
+    """
+    Index results by (voltage, frequency, workload) for constant-time lookups
+
+    When a key repeats (e.g. several runs concatenated into one file), the
+    first occurrence wins.
+    """
+    by_key = {}
+    for r in results:
+        by_key.setdefault((r["voltage"], r["frequency"], r["workload"]), r)
+    return by_key
+
+def columnarize_results(results, workloads, dvfs_points):
+    """
+    Convert results to one NumPy array per field, in file order
+
+    Plots select rows with boolean masks, e.g.
+    cols['frequency'][cols['workload'] == workload]. The 'workload_id' and
+    'dvfs_id' columns hold each row's index into the (sorted) workloads and
+    dvfs_points lists, for ordering and grouped reductions.
+    """
+    metric_names = ["ipc", "avg_power", "energy_per_inst",
+                    "icache_hit_rate", "dcache_hit_rate"]
+    
+    # np.fromiter fills each array straight from a generator, with no
+    # intermediate Python list
+    n = len(results)
+    cols = {
+        "voltage": np.fromiter((r["voltage"] for r in results), dtype=float, count=n),
+        "frequency": np.fromiter((r["frequency"] for r in results), dtype=float, count=n),
+        "workload": np.fromiter((r["workload"] for r in results), dtype=object, count=n),
+    }
+    workload_index = {workload: i for i, workload in enumerate(workloads)}
+    cols["workload_id"] = np.fromiter(
+        (workload_index[r["workload"]] for r in results), dtype=int, count=n)
+    point_index = {point: i for i, point in enumerate(dvfs_points)}
+    cols["dvfs_id"] = np.fromiter(
+        (point_index[(r["voltage"], r["frequency"])] for r in results), dtype=int, count=n)
+    for name in metric_names:
+        cols[name] = np.fromiter((r["metrics"][name] for r in results),
+                                 dtype=float, count=n)
+    
+    return cols
+
+def select_rows(cols, mask, order_by):
+    """
+    Return indices of rows where mask is set, sorted by the order_by column
+
+    Only the first row (in file order) for each order_by value is kept.
+    """
+    rows = np.flatnonzero(mask)
+    rows = rows[np.argsort(cols[order_by][rows], kind='stable')]
+    _, first = np.unique(cols[order_by][rows], return_index=True)
+    return rows[first]
 
 def generate_sample_dvfs_data():
     """Generate sample DVFS data for demonstration"""
-    print("Generating sample DVFS data...")
-    
-    dvfs_points = [
-        (0.6, 50), (0.7, 100), (0.8, 200),
-        (0.9, 400), (1.0, 600), (1.2, 800)
-    ]
+    from numpy.random import default_rng
     
-    workloads = ["healthcare_monitor_test", "intensive_ecg_processing", 
-                 "burst_transmission", "mixed_workload", 
-                 "idle_scenario", "stress_test"]
+    print("Generating sample DVFS data...")
+    rng = default_rng(42)  # Fixed seed so sample figures are reproducible
+    
+    dvfs_voltages = np.array([0.6, 0.7, 0.8, 0.9, 1.0, 1.2])
+    dvfs_frequencies = np.array([50, 100, 200, 400, 600, 800])
+    
+    workloads = np.array(["healthcare_monitor_test", "intensive_ecg_processing", 
+                          "burst_transmission", "mixed_workload", 
+                          "idle_scenario", "stress_test"], dtype=object)
+    
+    # Workload-specific adjustments, indexed like `workloads`
+    # (intensive ECG is compute bound, idle is mostly idle, stress is high utilization)
+    ipc_multipliers = np.array([1.0, 0.95, 1.0, 1.0, 0.30, 1.05])
+    workload_insts = np.array([200000, 200000, 200000, 200000, 50000, 500000])
+    
+    # One row per (DVFS point, workload), DVFS point varying slowest
+    n_workloads = len(workloads)
+    voltage = np.repeat(dvfs_voltages, n_workloads)
+    frequency = np.repeat(dvfs_frequencies, n_workloads)
+    workload = np.tile(workloads, len(dvfs_voltages))
+    sim_insts = np.tile(workload_insts, len(dvfs_voltages))
+    n = len(workload)
+    
+    # Generate realistic metrics based on DVFS point
+    base_ipc = (0.65 + (frequency / 800) * 0.20) * np.tile(ipc_multipliers, len(dvfs_voltages))
+    
+    # Power model: P = C*V^2*f + leakage
+    dynamic_power = (voltage ** 2) * frequency * base_ipc
+    static_power = voltage * 5
+    avg_power = dynamic_power + static_power
+    
+    sim_seconds = sim_insts / (frequency * 1e6 * base_ipc)
+    total_energy = avg_power * sim_seconds * 1000  # µJ
+    energy_per_inst = total_energy / sim_insts
+    
+    # Cache hit rates (relatively stable across DVFS)
+    icache_hit = 0.945 + rng.uniform(-0.01, 0.01, size=n)
+    dcache_hit = 0.955 + rng.uniform(-0.01, 0.01, size=n)
+    
+    # Round every metric column in one batch before serializing
+    metrics = {
+        "ipc": np.round(base_ipc, 3),
+        "cpi": np.round(1 / base_ipc, 3),
+        "avg_power": np.round(avg_power, 1),
+        "peak_power": np.round(avg_power * 1.3, 1),
+        "total_energy": np.round(total_energy, 2),
+        "energy_per_inst": np.round(energy_per_inst, 4),
+        "sim_insts": sim_insts,
+        "sim_seconds": np.round(sim_seconds, 6),
+        "icache_hit_rate": np.round(icache_hit, 4),
+        "dcache_hit_rate": np.round(dcache_hit, 4),
+    }
+    metric_rows = zip(*(column.tolist() for column in metrics.values()))
     
     results = []
     
-    for voltage, frequency in dvfs_points:
-        for workload in workloads:
-            # Generate realistic metrics based on DVFS point
-            base_ipc = 0.65 + (frequency / 800) * 0.20  # IPC increases with freq
-            
-            # Workload-specific adjustments
-            if workload == "intensive_ecg_processing":
-                base_ipc *= 0.95  # Compute intensive
-            elif workload == "idle_scenario":
-                base_ipc *= 0.30  # Mostly idle
-            elif workload == "stress_test":
-                base_ipc *= 1.05  # High utilization
-            
-            # Power model: P = C*V^2*f + leakage
-            dynamic_power = (voltage ** 2) * frequency * base_ipc
-            static_power = voltage * 5
-            avg_power = dynamic_power + static_power
-            
-            # Simulate instruction count variations
-            if workload == "stress_test":
-                sim_insts = 500000
-            elif workload == "idle_scenario":
-                sim_insts = 50000
-            else:
-                sim_insts = 200000
-            
-            sim_seconds = sim_insts / (frequency * 1e6 * base_ipc)
-            total_energy = avg_power * sim_seconds * 1000  # µJ
-            energy_per_inst = total_energy / sim_insts
-            
-            # Cache hit rates (relatively stable across DVFS)
-            icache_hit = 0.945 + np.random.uniform(-0.01, 0.01)
-            dcache_hit = 0.955 + np.random.uniform(-0.01, 0.01)
-            
-            results.append({
-                "voltage": voltage,
-                "frequency": frequency,
-                "workload": workload,
-                "metrics": {
-                    "ipc": round(base_ipc, 3),
-                    "cpi": round(1/base_ipc, 3),
-                    "avg_power": round(avg_power, 1),
-                    "peak_power": round(avg_power * 1.3, 1),
-                    "total_energy": round(total_energy, 2),
-                    "energy_per_inst": round(energy_per_inst, 4),
-                    "sim_insts": sim_insts,
-                    "sim_seconds": round(sim_seconds, 6),
-                    "icache_hit_rate": round(icache_hit, 4),
-                    "dcache_hit_rate": round(dcache_hit, 4)
-                }
-            })
+    for v, f, w, row in zip(voltage.tolist(), frequency.tolist(),
+                            workload.tolist(), metric_rows):
+        results.append({
+            "voltage": v,
+            "frequency": f,
+            "workload": w,
+            "metrics": dict(zip(metrics, row))
+        })
     
     return results
 
-def plot_dvfs_power_performance(results):
+def draw_dvfs_power_performance(ax, cols, workloads, labels):
     """
-    Figure 1: Power-Performance Trade-off Across DVFS Operating Points
+    Draw Figure 1 (Power-Performance Trade-off Across DVFS Operating Points) onto ax
     """
-    fig, ax = plt.subplots(figsize=(7, 5))
-    
     # Group by workload
-    workloads = list(set([r["workload"] for r in results]))
     colors = plt.cm.tab10(np.linspace(0, 1, len(workloads)))
     
-    for i, workload in enumerate(sorted(workloads)):
-        workload_results = [r for r in results if r["workload"] == workload]
-        
-        frequencies = [r["frequency"] for r in workload_results]
-        avg_powers = [r["metrics"]["avg_power"] for r in workload_results]
-        ipcs = [r["metrics"]["ipc"] for r in workload_results]
+    for i, workload in enumerate(workloads):
+        mask = cols["workload_id"] == i
         
         # Plot power vs frequency
-        label = workload.replace("_", " ").title()
-        ax.plot(frequencies, avg_powers, 'o-', color=colors[i], 
-                label=label, linewidth=2, markersize=6)
+        ax.plot(cols["frequency"][mask], cols["avg_power"][mask], 'o-',
+                color=colors[i], label=labels[workload], linewidth=2, markersize=6)
     
     ax.set_xlabel('Frequency (MHz)')
     ax.set_ylabel('Average Power (mW)')
@@ -143,144 +223,120 @@ def plot_dvfs_power_performance(results):
     ax.legend(loc='upper left', frameon=True, fancybox=False, edgecolor='black')
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.set_xlim(0, 850)
+
+def plot_dvfs_power_performance(cols, workloads, labels):
+    """
+    Figure 1: Power-Performance Trade-off Across DVFS Operating Points
+    """
+    fig, ax = reuse_figure((7, 5))
+    draw_dvfs_power_performance(ax, cols, workloads, labels)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure1_dvfs_power_performance.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 1: DVFS Power-Performance Trade-off")
+    fig.savefig(f"{FIGURES_DIR}/figure1_dvfs_power_performance.png", **FIG_KW)
+    return "✓ Generated Figure 1: DVFS Power-Performance Trade-off"
 
-def plot_energy_efficiency(results):
+def draw_energy_efficiency(ax, cols, dvfs_points):
     """
-    Figure 2: Energy Efficiency Across DVFS Points
+    Draw Figure 2 (Energy Efficiency Across DVFS Points) onto ax
     """
-    fig, ax = plt.subplots(figsize=(7, 5))
-    
-    # Calculate average energy per instruction for each DVFS point
-    dvfs_points = sorted(list(set([(r["voltage"], r["frequency"]) for r in results])))
-    
-    frequencies = []
-    voltages = []
-    avg_epi = []
-    
-    for voltage, frequency in dvfs_points:
-        point_results = [r for r in results 
-                        if r["voltage"] == voltage and r["frequency"] == frequency]
-        
-        # Average across non-idle workloads
-        active_results = [r for r in point_results 
-                         if r["workload"] != "idle_scenario"]
-        
-        if active_results:
-            epi = np.mean([r["metrics"]["energy_per_inst"] for r in active_results])
-            frequencies.append(frequency)
-            voltages.append(voltage)
-            avg_epi.append(epi)
+    # Calculate average energy per instruction for each DVFS point,
+    # across non-idle workloads
+    active = cols["workload"] != "idle_scenario"
+    dvfs_id = cols["dvfs_id"][active]
+    sums = np.bincount(dvfs_id, weights=cols["energy_per_inst"][active],
+                       minlength=len(dvfs_points))
+    counts = np.bincount(dvfs_id, minlength=len(dvfs_points))
+    
+    # Skip DVFS points with no active workloads
+    has_active = counts > 0
+    avg_epi = sums[has_active] / counts[has_active]
+    voltages = np.array([v for v, _ in dvfs_points])[has_active]
+    frequencies = np.array([f for _, f in dvfs_points])[has_active]
     
     # Create bar chart with color gradient by voltage
-    colors = plt.cm.viridis(np.array(voltages) / max(voltages))
+    colors = plt.cm.viridis(voltages / voltages.max())
     bars = ax.bar(range(len(frequencies)), avg_epi, color=colors, edgecolor='black', linewidth=0.8)
     
     # Add voltage labels on bars
-    for i, (bar, voltage) in enumerate(zip(bars, voltages)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{voltage}V', ha='center', va='bottom', fontsize=8)
+    ax.bar_label(bars, labels=[f'{voltage}V' for voltage in voltages.tolist()], fontsize=8)
     
     ax.set_xlabel('DVFS Operating Point')
     ax.set_ylabel('Energy per Instruction (µJ/inst)')
     ax.set_title('Figure 2\nEnergy Efficiency Across DVFS Operating Points')
     ax.set_xticks(range(len(frequencies)))
-    ax.set_xticklabels([f'{f}MHz' for f in frequencies], rotation=45, ha='right')
+    ax.set_xticklabels([f'{f}MHz' for f in frequencies.tolist()], rotation=45, ha='right')
     ax.grid(True, axis='y', alpha=0.3, linestyle='--')
     
     # Find optimal point
     optimal_idx = np.argmin(avg_epi)
     bars[optimal_idx].set_edgecolor('red')
     bars[optimal_idx].set_linewidth(2.5)
+
+def plot_energy_efficiency(cols, dvfs_points):
+    """
+    Figure 2: Energy Efficiency Across DVFS Points
+    """
+    fig, ax = reuse_figure((7, 5))
+    draw_energy_efficiency(ax, cols, dvfs_points)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure2_energy_efficiency.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 2: Energy Efficiency")
+    fig.savefig(f"{FIGURES_DIR}/figure2_energy_efficiency.png", **FIG_KW)
+    return "✓ Generated Figure 2: Energy Efficiency"
 
-def plot_ipc_comparison(results):
+def draw_ipc_comparison(ax, cols, labels):
     """
-    Figure 3: IPC Performance Across Workloads
+    Draw Figure 3 (IPC Performance Across Workloads) onto ax
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    workloads = sorted(list(set([r["workload"] for r in results])))
-    
-    # Filter for max performance DVFS point (1.2V, 800MHz)
-    max_perf_results = [r for r in results 
-                       if r["voltage"] == 1.2 and r["frequency"] == 800]
-    
-    ipcs = []
-    labels = []
-    
-    for workload in workloads:
-        workload_result = next((r for r in max_perf_results 
-                               if r["workload"] == workload), None)
-        if workload_result:
-            ipcs.append(workload_result["metrics"]["ipc"])
-            label = workload.replace("_", " ").title()
-            labels.append(label)
+    # Max performance DVFS point (1.2V, 800MHz), one row per workload
+    rows = select_rows(cols, (cols["voltage"] == 1.2) & (cols["frequency"] == 800),
+                       "workload_id")
+    ipcs = cols["ipc"][rows]
+    bar_labels = [labels[w] for w in cols["workload"][rows]]
     
     # Create horizontal bar chart
-    y_pos = np.arange(len(labels))
-    colors = plt.cm.Paired(np.linspace(0, 1, len(labels)))
+    y_pos = np.arange(len(bar_labels))
+    colors = plt.cm.Paired(np.linspace(0, 1, len(bar_labels)))
     bars = ax.barh(y_pos, ipcs, color=colors, edgecolor='black', linewidth=0.8)
     
     # Add value labels
-    for i, (bar, ipc) in enumerate(zip(bars, ipcs)):
-        width = bar.get_width()
-        ax.text(width, bar.get_y() + bar.get_height()/2.,
-                f' {ipc:.3f}', ha='left', va='center', fontsize=9)
+    ax.bar_label(bars, fmt=' {:.3f}', fontsize=9)
     
     ax.set_yticks(y_pos)
-    ax.set_yticklabels(labels)
+    ax.set_yticklabels(bar_labels)
     ax.set_xlabel('Instructions Per Cycle (IPC)')
     ax.set_title('Figure 3\nIPC Performance Across Workloads (1.2V, 800MHz)')
     ax.grid(True, axis='x', alpha=0.3, linestyle='--')
-    ax.set_xlim(0, max(ipcs) * 1.15)
+    ax.set_xlim(0, ipcs.max() * 1.15)
     
     # Add reference line at IPC=0.75 (target)
     ax.axvline(x=0.75, color='red', linestyle='--', linewidth=1.5, 
                label='Target (0.75)', alpha=0.7)
     ax.legend(loc='lower right')
+
+def plot_ipc_comparison(cols, labels):
+    """
+    Figure 3: IPC Performance Across Workloads
+    """
+    fig, ax = reuse_figure((8, 5))
+    draw_ipc_comparison(ax, cols, labels)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure3_ipc_comparison.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 3: IPC Performance Comparison")
+    fig.savefig(f"{FIGURES_DIR}/figure3_ipc_comparison.png", **FIG_KW)
+    return "✓ Generated Figure 3: IPC Performance Comparison"
 
-def plot_cache_performance(results):
+def draw_cache_performance(ax, cols, labels):
     """
-    Figure 4: Cache Hit Rates by Workload
+    Draw Figure 4 (Cache Hit Rates by Workload) onto ax
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    workloads = sorted(list(set([r["workload"] for r in results])))
-    
-    # Get cache data for balanced DVFS point (0.9V, 400MHz)
-    balanced_results = [r for r in results 
-                       if r["voltage"] == 0.9 and r["frequency"] == 400]
-    
-    icache_hits = []
-    dcache_hits = []
-    labels = []
-    
-    for workload in workloads:
-        workload_result = next((r for r in balanced_results 
-                               if r["workload"] == workload), None)
-        if workload_result:
-            icache_hits.append(workload_result["metrics"]["icache_hit_rate"] * 100)
-            dcache_hits.append(workload_result["metrics"]["dcache_hit_rate"] * 100)
-            label = workload.replace("_", "\n").title()
-            labels.append(label)
+    # Cache data for balanced DVFS point (0.9V, 400MHz), one row per workload
+    rows = select_rows(cols, (cols["voltage"] == 0.9) & (cols["frequency"] == 400),
+                       "workload_id")
+    icache_hits = cols["icache_hit_rate"][rows] * 100
+    dcache_hits = cols["dcache_hit_rate"][rows] * 100
+    bar_labels = [labels[w].replace(" ", "\n") for w in cols["workload"][rows]]
     
     # Create grouped bar chart
-    x = np.arange(len(labels))
+    x = np.arange(len(bar_labels))
     width = 0.35
     
     bars1 = ax.bar(x - width/2, icache_hits, width, label='I-Cache',
@@ -290,15 +346,12 @@ def plot_cache_performance(results):
     
     # Add value labels
     for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom', fontsize=7)
+        ax.bar_label(bars, fmt='{:.1f}%', fontsize=7)
     
     ax.set_ylabel('Hit Rate (%)')
     ax.set_title('Figure 4\nCache Performance by Workload Type')
     ax.set_xticks(x)
-    ax.set_xticklabels(labels, rotation=0, ha='center', fontsize=8)
+    ax.set_xticklabels(bar_labels, rotation=0, ha='center', fontsize=8)
     ax.legend(loc='lower left', frameon=True, fancybox=False, edgecolor='black')
     ax.grid(True, axis='y', alpha=0.3, linestyle='--')
     ax.set_ylim(85, 100)
@@ -306,39 +359,36 @@ def plot_cache_performance(results):
     # Add target line
     ax.axhline(y=95, color='green', linestyle='--', linewidth=1.5, 
                label='Target (95%)', alpha=0.7)
+
+def plot_cache_performance(cols, labels):
+    """
+    Figure 4: Cache Hit Rates by Workload
+    """
+    fig, ax = reuse_figure((8, 5))
+    draw_cache_performance(ax, cols, labels)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure4_cache_performance.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 4: Cache Performance")
+    fig.savefig(f"{FIGURES_DIR}/figure4_cache_performance.png", **FIG_KW)
+    return "✓ Generated Figure 4: Cache Performance"
 
-def plot_power_breakdown(results):
+def draw_power_breakdown(ax, cols, dvfs_points):
     """
-    Figure 5: Power Consumption Breakdown by Operating Point
+    Draw Figure 5 (Power Consumption Breakdown by Operating Point) onto ax
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    # Get average power for healthcare_monitor_test across all DVFS points
-    dvfs_points = sorted(list(set([(r["voltage"], r["frequency"]) for r in results])))
+    # Get average power for healthcare_monitor_test across all DVFS points,
+    # ordered by DVFS point
+    rows = select_rows(cols, cols["workload"] == "healthcare_monitor_test", "dvfs_id")
+    voltages = cols["voltage"][rows]
+    total_power = cols["avg_power"][rows]
     
-    frequencies = []
-    dynamic_power = []
-    static_power = []
+    # Estimate static power (leakage)
+    static_power = voltages * 5
+    dynamic_power = total_power - static_power
     
-    for voltage, frequency in dvfs_points:
-        point_result = next((r for r in results 
-                            if r["voltage"] == voltage and r["frequency"] == frequency
-                            and r["workload"] == "healthcare_monitor_test"), None)
-        
-        if point_result:
-            total_power = point_result["metrics"]["avg_power"]
-            # Estimate static power (leakage)
-            static_p = voltage * 5
-            dynamic_p = total_power - static_p
-            
-            frequencies.append(f"{frequency}MHz\n({voltage}V)")
-            dynamic_power.append(dynamic_p)
-            static_power.append(static_p)
+    # Tick labels use the original (voltage, frequency) values, not the
+    # float columns
+    frequencies = [f"{frequency}MHz\n({voltage}V)" for voltage, frequency
+                   in (dvfs_points[i] for i in cols["dvfs_id"][rows].tolist())]
     
     # Create stacked bar chart
     x = np.arange(len(frequencies))
@@ -351,9 +401,7 @@ def plot_power_breakdown(results):
                 edgecolor='black', linewidth=0.8)
     
     # Add total power labels
-    for i, (d, s) in enumerate(zip(dynamic_power, static_power)):
-        total = d + s
-        ax.text(i, total, f'{total:.1f}mW', ha='center', va='bottom', fontsize=8)
+    ax.bar_label(p2, labels=[f'{total:.1f}mW' for total in total_power.tolist()], fontsize=8)
     
     ax.set_ylabel('Power Consumption (mW)')
     ax.set_xlabel('DVFS Operating Point')
@@ -362,109 +410,154 @@ def plot_power_breakdown(results):
     ax.set_xticklabels(frequencies)
     ax.legend(loc='upper left', frameon=True, fancybox=False, edgecolor='black')
     ax.grid(True, axis='y', alpha=0.3, linestyle='--')
+
+def plot_power_breakdown(cols, dvfs_points):
+    """
+    Figure 5: Power Consumption Breakdown by Operating Point
+    """
+    fig, ax = reuse_figure((8, 5))
+    draw_power_breakdown(ax, cols, dvfs_points)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure5_power_breakdown.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 5: Power Breakdown")
+    fig.savefig(f"{FIGURES_DIR}/figure5_power_breakdown.png", **FIG_KW)
+    return "✓ Generated Figure 5: Power Breakdown"
 
-def plot_dvfs_efficiency_curve(results):
+def draw_dvfs_efficiency_curve(ax, cols, dvfs_points):
     """
-    Figure 6: DVFS Energy-Performance Efficiency Curve
+    Draw Figure 6 (DVFS Energy-Performance Efficiency Curve) onto ax
     """
-    fig, ax = plt.subplots(figsize=(7, 5))
-    
     # Calculate efficiency metric: IPC / Power for each DVFS point
-    dvfs_points = sorted(list(set([(r["voltage"], r["frequency"]) for r in results])))
-    
     # Use healthcare_monitor_test as baseline workload
-    frequencies = []
-    efficiencies = []
-    voltages = []
-    
-    for voltage, frequency in dvfs_points:
-        point_result = next((r for r in results 
-                            if r["voltage"] == voltage and r["frequency"] == frequency
-                            and r["workload"] == "healthcare_monitor_test"), None)
-        
-        if point_result:
-            ipc = point_result["metrics"]["ipc"]
-            power = point_result["metrics"]["avg_power"]
-            efficiency = (ipc / power) * 1000  # IPC per watt
-            
-            frequencies.append(frequency)
-            efficiencies.append(efficiency)
-            voltages.append(voltage)
+    rows = select_rows(cols, cols["workload"] == "healthcare_monitor_test", "dvfs_id")
+    frequencies = cols["frequency"][rows]
+    efficiencies = (cols["ipc"][rows] / cols["avg_power"][rows]) * 1000  # IPC per watt
     
     # Plot efficiency curve
     ax.plot(frequencies, efficiencies, 'o-', color='darkgreen', 
             linewidth=2.5, markersize=8, markerfacecolor='lightgreen',
             markeredgecolor='darkgreen', markeredgewidth=2)
     
-    # Annotate each point with voltage
-    for freq, eff, volt in zip(frequencies, efficiencies, voltages):
+    # Annotate each point with voltage, labelled from the original values
+    points = [dvfs_points[i] for i in cols["dvfs_id"][rows].tolist()]
+    for freq, eff, (volt, _) in zip(frequencies.tolist(), efficiencies.tolist(), points):
         ax.annotate(f'{volt}V', xy=(freq, eff), xytext=(5, 5),
                    textcoords='offset points', fontsize=8)
     
     # Highlight optimal point
     optimal_idx = np.argmax(efficiencies)
     ax.plot(frequencies[optimal_idx], efficiencies[optimal_idx], 'r*',
-            markersize=20, label=f'Optimal: {frequencies[optimal_idx]}MHz')
+            markersize=20, label=f'Optimal: {points[optimal_idx][1]}MHz')
     
     ax.set_xlabel('Frequency (MHz)')
     ax.set_ylabel('Energy Efficiency (IPC/mW × 1000)')
     ax.set_title('Figure 6\nDVFS Energy-Performance Efficiency Curve')
     ax.legend(loc='best', frameon=True, fancybox=False, edgecolor='black')
     ax.grid(True, alpha=0.3, linestyle='--')
+
+def plot_dvfs_efficiency_curve(cols, dvfs_points):
+    """
+    Figure 6: DVFS Energy-Performance Efficiency Curve
+    """
+    fig, ax = reuse_figure((7, 5))
+    draw_dvfs_efficiency_curve(ax, cols, dvfs_points)
     
     plt.tight_layout()
-    plt.savefig(f"{FIGURES_DIR}/figure6_dvfs_efficiency.png", dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated Figure 6: DVFS Efficiency Curve")
+    fig.savefig(f"{FIGURES_DIR}/figure6_dvfs_efficiency.png", **FIG_KW)
+    return "✓ Generated Figure 6: DVFS Efficiency Curve"
 
-def generate_results_table():
+def plot_all_in_one(cols, workloads, dvfs_points, labels):
     """
-    Table 1: Performance Metrics Summary
+    Composite: Figures 1-6 as panels of a single 2x3 figure
+
+    Renders, lays out and encodes one PNG instead of six.
     """
-    results = load_dvfs_results()
+    fig, axes = reuse_figure((18, 10), nrows=2, ncols=3)
     
+    ax1, ax2, ax3, ax4, ax5, ax6 = axes.flat
+    draw_dvfs_power_performance(ax1, cols, workloads, labels)
+    draw_energy_efficiency(ax2, cols, dvfs_points)
+    draw_ipc_comparison(ax3, cols, labels)
+    draw_cache_performance(ax4, cols, labels)
+    draw_power_breakdown(ax5, cols, dvfs_points)
+    draw_dvfs_efficiency_curve(ax6, cols, dvfs_points)
+    
+    plt.tight_layout()
+    fig.savefig(f"{FIGURES_DIR}/composite.png", **FIG_KW)
+    return "✓ Generated Composite: Figures 1-6"
+
+def generate_results_table(by_key, labels):
+    """
+    Table 1: Performance Metrics Summary
+    """
     # Select key DVFS points and workloads for table
     selected_points = [(0.6, 50), (0.8, 200), (1.0, 600), (1.2, 800)]
     selected_workloads = ["healthcare_monitor_test", "intensive_ecg_processing", 
                          "mixed_workload", "stress_test"]
     
-    table_data = []
+    header = ["DVFS", "Workload", "IPC", "Power (mW)", "Energy/Inst (µJ)",
+              "I-Cache Hit", "D-Cache Hit"]
+    table_rows = []
     
     for voltage, frequency in selected_points:
         for workload in selected_workloads:
-            result = next((r for r in results 
-                          if r["voltage"] == voltage and r["frequency"] == frequency
-                          and r["workload"] == workload), None)
+            result = by_key.get((voltage, frequency, workload))
             
             if result:
                 m = result["metrics"]
-                table_data.append({
-                    "DVFS": f"{voltage}V/{frequency}MHz",
-                    "Workload": workload.replace("_", " ").title(),
-                    "IPC": f"{m['ipc']:.3f}",
-                    "Power (mW)": f"{m['avg_power']:.1f}",
-                    "Energy/Inst (µJ)": f"{m['energy_per_inst']:.4f}",
-                    "I-Cache Hit": f"{m['icache_hit_rate']*100:.1f}%",
-                    "D-Cache Hit": f"{m['dcache_hit_rate']*100:.1f}%"
-                })
+                table_rows.append((
+                    f"{voltage}V/{frequency}MHz",
+                    labels[workload],
+                    f"{m['ipc']:.3f}",
+                    f"{m['avg_power']:.1f}",
+                    f"{m['energy_per_inst']:.4f}",
+                    f"{m['icache_hit_rate']*100:.1f}%",
+                    f"{m['dcache_hit_rate']*100:.1f}%"
+                ))
     
     # Save as CSV
     import csv
     csv_file = f"{FIGURES_DIR}/table1_performance_metrics.csv"
     with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=table_data[0].keys())
-        writer.writeheader()
-        writer.writerows(table_data)
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(table_rows)
     
     print(f"✓ Generated Table 1: Performance Metrics Summary ({csv_file})")
 
-def generate_all_figures():
-    """Generate all figures for Phase 3 report"""
+def run_plots(plot_jobs):
+    """
+    Run independent (plot function, args) jobs, one worker process per figure
+
+    Each figure writes its own PNG, so they can render in parallel. Falls
+    back to running in-process when only one CPU is available. Returns the
+    plot functions' status lines in job order, for the caller to print.
+    """
+    max_workers = min(len(plot_jobs), os.cpu_count() or 1)
+    
+    if max_workers <= 1:
+        return [plot(*args) for plot, args in plot_jobs]
+    
+    # On Linux, fork so workers inherit the imported matplotlib state; other
+    # platforms keep their default start method (spawn on macOS and Windows)
+    if sys.platform.startswith("linux"):
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context = None
+    
+    # Flush so forked workers don't re-emit buffered output
+    sys.stdout.flush()
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        futures = [executor.submit(plot, *args) for plot, args in plot_jobs]
+        return [future.result() for future in futures]
+
+def generate_all_figures(composite=False):
+    """
+    Generate all figures for Phase 3 report
+
+    With composite=True, Figures 1-6 are written as panels of a single
+    composite.png instead of six separate files.
+    """
     print("="*70)
     print("Phase 3 Results Analysis and Visualization")
     print("="*70)
@@ -478,19 +571,38 @@ def generate_all_figures():
     results = load_dvfs_results()
     print(f"Loaded {len(results)} result entries\n")
     
+    # Distinct workloads and DVFS points, shared by every figure
+    workloads = sorted({r["workload"] for r in results})
+    dvfs_points = sorted({(r["voltage"], r["frequency"]) for r in results})
+    cols = columnarize_results(results, workloads, dvfs_points)
+    labels = {w: w.replace("_", " ").title() for w in workloads}
+    
     # Generate all figures
     print("Generating figures...")
-    plot_dvfs_power_performance(results)
-    plot_energy_efficiency(results)
-    plot_ipc_comparison(results)
-    plot_cache_performance(results)
-    plot_power_breakdown(results)
-    plot_dvfs_efficiency_curve(results)
-    generate_results_table()
+    if composite:
+        print(plot_all_in_one(cols, workloads, dvfs_points, labels))
+    else:
+        # Each job gets only the inputs its figure reads, keeping what is
+        # pickled to worker processes small
+        statuses = run_plots([
+            (plot_dvfs_power_performance, (cols, workloads, labels)),
+            (plot_energy_efficiency, (cols, dvfs_points)),
+            (plot_ipc_comparison, (cols, labels)),
+            (plot_cache_performance, (cols, labels)),
+            (plot_power_breakdown, (cols, dvfs_points)),
+            (plot_dvfs_efficiency_curve, (cols, dvfs_points)),
+        ])
+        for status in statuses:
+            print(status)
+    generate_results_table(index_results(results), labels)
+    plt.close('all')
     
     print("\n" + "="*70)
     print(f"All figures generated successfully!")
-    print(f"Figures saved to: {FIGURES_DIR}/")
+    if composite:
+        print(f"Composite figure saved to: {FIGURES_DIR}/composite.png")
+    else:
+        print(f"Figures saved to: {FIGURES_DIR}/")
     print("="*70)
     print("\nFigure Reference Guide for Report:")
     print("  Figure 1: DVFS Power-Performance Trade-off")
@@ -499,7 +611,9 @@ def generate_all_figures():
     print("  Figure 4: Cache Performance by Workload")
     print("  Figure 5: Power Consumption Breakdown")
     print("  Figure 6: DVFS Efficiency Curve")
+    if composite:
+        print("  (Figures 1-6 are the panels of composite.png)")
     print("  Table 1: Performance Metrics Summary")
 
 if __name__ == "__main__":
-    generate_all_figures()
+    generate_all_figures(composite="--composite" in sys.argv[1:])